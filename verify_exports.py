@@ -15,12 +15,12 @@ The reference definitions live inside this script in REFERENCE_FILES.
 Each entry specifies:
   - folder / filename
   - expected column headers
-  - per-row, per-column expected values (exact string OR regex pattern)
+  - per-row, per-column expected values (exact string OR pattern token)
 
 Dynamic data rules
 ------------------
-Columns whose values change between runs are matched with regex patterns
-instead of exact strings.  The following pattern tokens are used:
+Columns whose values change between runs are matched with pattern tokens
+instead of exact strings.  The following tokens are used:
 
   DATETIME       dd-Mon-yyyy HH:MM:SS   e.g. 19-Feb-2026 11:55:33
   DATE_SLASH     dd/mm/yyyy             e.g. 24/02/2000
@@ -31,28 +31,41 @@ instead of exact strings.  The following pattern tokens are used:
   EMPTY          must be empty
   NONEMPTY       at least one character
 
-These are expanded into proper regex when the script runs.
+Each token is compiled once into a kind code with its own check: a regex
+fullmatch for the date tokens, str.isdecimal for the integer tokens, and
+plain comparisons for ANY, EMPTY and NONEMPTY.  Any other cell spec is an
+exact literal.  PATTERN_MAP records the regex each token stands for.
 """
 
 import csv
+import functools
 import io
 import os
 import re
 import sys
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Regex building blocks
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Month abbreviations as they appear in exported datetimes
+_MONTHS = frozenset({
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+})
+
 # Matches: dd-Mon-yyyy HH:MM:SS  (e.g. 20-Feb-2026 14:55:06)
-_DATETIME_RE = r"\d{1,2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}:\d{2}"
+_DATETIME_RE = rf"\d{{1,2}}-(?:{'|'.join(sorted(_MONTHS))})-\d{{4}} \d{{2}}:\d{{2}}:\d{{2}}"
+_datetime_fullmatch = re.compile(_DATETIME_RE).fullmatch
 
 # Matches: dd/mm/yyyy  (e.g. 24/02/2000)
 _DATE_SLASH_RE = r"\d{1,2}/\d{2}/\d{4}"
+_date_slash_fullmatch = re.compile(_DATE_SLASH_RE).fullmatch
 
 # Matches a positive integer (one or more digits)
 _INTEGER_RE = r"\d+"
@@ -65,44 +78,151 @@ PATTERN_MAP = {
     "INTEGER":     _INTEGER_RE,
     "NUMERIC_ID":  _INTEGER_RE,
     "ANY":         r".*",
-    "EMPTY":       r"^$",
+    "EMPTY":       r"",
     "NONEMPTY":    r".+",
 }
 
+# Compiled cell-spec kinds.  Each compiled row is stored as two parallel
+# sequences – an array of these codes and a tuple of payloads – and the
+# cell loop dispatches on the code.
+_KIND_ANY        = 0   # accepts every value; payload unused
+_KIND_LITERAL    = 1   # payload is the exact expected string
+_KIND_DATETIME   = 2   # checked by _DATETIME_RE; payload unused
+_KIND_INTEGER    = 3   # checked by str.isdecimal; payload unused
+_KIND_DATE_SLASH = 4   # checked by _DATE_SLASH_RE; payload unused
+_KIND_EMPTY      = 5   # value must be ""; payload unused
+_KIND_NONEMPTY   = 6   # value must not be ""; payload unused
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Placeholder / pseudo-blank detection
 # ─────────────────────────────────────────────────────────────────────────────
 # These patterns catch values that *look* like they were meant to be blank or
 # are serialisation artefacts rather than genuine data.
 
-PLACEHOLDER_PATTERNS: list[tuple[re.Pattern, str]] = [
-    # JavaScript serialisation bug
-    (re.compile(r"\[object Object\]"),      "JavaScript [object Object] — serialisation bug"),
-    (re.compile(r"\[object .+\]"),          "JavaScript [object ...] — serialisation bug"),
-    # Whitespace-only strings pretending to be blank
-    (re.compile(r"^\s+$"),                  "Whitespace-only value (should be truly empty)"),
+# Exact placeholder strings → reason.  Case-insensitive entries are keyed by
+# their casefolded form; the case-sensitive ones ("NaN", "None") are keyed
+# as-is, so a lookup tries the raw value first and then its casefold.  One
+# trailing line ending (\r\n, \r or \n) is ignored.
+_LITERAL_PLACEHOLDERS: dict[str, str] = {
     # Common programmatic null / placeholder strings
-    (re.compile(r"^null$", re.I),           "Literal 'null' — likely a code artifact"),
-    (re.compile(r"^undefined$", re.I),      "Literal 'undefined' — likely a code artifact"),
-    (re.compile(r"^NaN$"),                  "Literal 'NaN' — likely a code artifact"),
-    (re.compile(r"^None$"),                 "Literal 'None' — likely a Python artifact"),
-    (re.compile(r"^#N/A$", re.I),           "Spreadsheet error value '#N/A'"),
-    (re.compile(r"^#REF!$", re.I),          "Spreadsheet error value '#REF!'"),
-    (re.compile(r"^#VALUE!$", re.I),        "Spreadsheet error value '#VALUE!'"),
-    (re.compile(r"^#DIV/0!$", re.I),        "Spreadsheet error value '#DIV/0!'"),
-]
-
-
-def _compile_pattern(token_or_literal: str) -> re.Pattern:
-    """Return a compiled regex.
-
-    If *token_or_literal* is a key in PATTERN_MAP it is expanded;
-    otherwise the string is treated as a literal (escaped) match.
+    "null":      "Literal 'null' — likely a code artifact",
+    "undefined": "Literal 'undefined' — likely a code artifact",
+    "NaN":       "Literal 'NaN' — likely a code artifact",
+    "None":      "Literal 'None' — likely a Python artifact",
+    # Spreadsheet error values
+    "#n/a":      "Spreadsheet error value '#N/A'",
+    "#ref!":     "Spreadsheet error value '#REF!'",
+    "#value!":   "Spreadsheet error value '#VALUE!'",
+    "#div/0!":   "Spreadsheet error value '#DIV/0!'",
+}
+
+# Longest key above; anything longer (past one trailing line ending) can skip
+# the dict lookups entirely.
+_MAX_LITERAL_PLACEHOLDER_LEN = max(map(len, _LITERAL_PLACEHOLDERS))
+
+# JavaScript serialisation bugs can appear anywhere in a value, so these are
+# searched for as one alternation of named groups, and the name of the group
+# that matched selects the reason.  A search reports the leftmost match
+# rather than the first alternative, so _placeholder_reason tests for
+# "[object Object]" on its own first.  The generic pattern doesn't span a
+# line break of any style.
+_SEARCHED_PLACEHOLDERS: tuple[tuple[str, str, str], ...] = (
+    ("object_object", r"\[object Object\]",   "JavaScript [object Object] — serialisation bug"),
+    ("object_other",  r"\[object [^\r\n]+\]", "JavaScript [object ...] — serialisation bug"),
+)
+_PLACEHOLDER_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _SEARCHED_PLACEHOLDERS)
+)
+_PLACEHOLDER_RE_REASONS = {name: reason for name, _, reason in _SEARCHED_PLACEHOLDERS}
+
+# Whitespace-only strings pretending to be blank (used with fullmatch)
+_WHITESPACE_ONLY_RE = re.compile(r"\s+")
+
+
+def _placeholder_reason(value: str) -> Optional[str]:
+    """Return why *value* looks like a placeholder, or None if it doesn't.
+
+    Most cells are empty or ordinary data, so each check is guarded by a
+    cheap test (length, substring, first character) that rejects them
+    before any dict lookup or regex runs.
+    """
+    if not value:
+        return None
+    if len(value) <= _MAX_LITERAL_PLACEHOLDER_LEN + 2:
+        if value.endswith("\r\n"):
+            key = value[:-2]
+        elif value[-1] in "\r\n":
+            key = value[:-1]
+        else:
+            key = value
+        reason = _LITERAL_PLACEHOLDERS.get(key) or _LITERAL_PLACEHOLDERS.get(key.casefold())
+        if reason is not None:
+            return reason
+    if "[object " in value:
+        if "[object Object]" in value:
+            return _PLACEHOLDER_RE_REASONS["object_object"]
+        m = _PLACEHOLDER_RE.search(value)
+        if m is not None:
+            return _PLACEHOLDER_RE_REASONS[m.lastgroup]
+    if value[0].isspace() and _WHITESPACE_ONLY_RE.fullmatch(value):
+        return "Whitespace-only value (should be truly empty)"
+    return None
+
+
+# Row-level prefilter for scan_placeholders.  A row's cells are each
+# prefixed with a unit separator (\x1f) and joined, and the result is
+# searched once for a cell that starts with whitespace or equals (ignoring
+# ASCII case and one trailing line ending) a literal placeholder; "[object "
+# is a plain substring test.
+# Together these fire wherever _placeholder_reason could, so a row that
+# passes both has no placeholders.  IGNORECASE only agrees with casefold on
+# ASCII text, and \x1f is itself whitespace, so rows that are not ASCII or
+# whose cells contain \x1f bypass the prefilter.
+_ROW_PLACEHOLDER_RE = re.compile(
+    r"\x1f(?:[^\S\x1f]|(?i:"
+    + "|".join(map(re.escape, _LITERAL_PLACEHOLDERS))
+    + r")(?:\r\n|\r|\n)?(?:\x1f|$))"
+)
+
+
+@functools.cache
+def _compile_pattern(token_or_literal: str) -> tuple[int, Optional[str]]:
+    """Return the ``(kind, payload)`` pair for one cell spec.
+
+    Every PATTERN_MAP token has its own kind and no payload; any other
+    string is a literal, checked by plain equality.  Results are cached
+    per token.
     """
-    if token_or_literal in PATTERN_MAP:
-        return re.compile(rf"^{PATTERN_MAP[token_or_literal]}$")
-    # Treat as exact literal
-    return re.compile(rf"^{re.escape(token_or_literal)}$")
+    if token_or_literal == "ANY":
+        return _KIND_ANY, None
+    if token_or_literal in ("DATETIME", "DATE_ONLY"):
+        return _KIND_DATETIME, None
+    if token_or_literal in ("INTEGER", "NUMERIC_ID"):
+        # str.isdecimal() is a C-level fullmatch of \d+: it is False for ""
+        # and accepts exactly the characters \d does.
+        return _KIND_INTEGER, None
+    if token_or_literal == "DATE_SLASH":
+        return _KIND_DATE_SLASH, None
+    if token_or_literal == "EMPTY":
+        return _KIND_EMPTY, None
+    if token_or_literal == "NONEMPTY":
+        return _KIND_NONEMPTY, None
+    # Exact literal – no need for the regex engine
+    return _KIND_LITERAL, sys.intern(token_or_literal)
+
+
+# Per-kind cell validators, indexed by _KIND_* code.  Each takes the
+# stripped value and the cell's payload.
+_KIND_CHECKS: tuple[Callable[[str, object], bool], ...] = (
+    lambda v, p: True,                                  # _KIND_ANY
+    lambda v, p: v == p,                                # _KIND_LITERAL
+    lambda v, p: _datetime_fullmatch(v) is not None,    # _KIND_DATETIME
+    lambda v, p: v.isdecimal(),                         # _KIND_INTEGER
+    lambda v, p: _date_slash_fullmatch(v) is not None,  # _KIND_DATE_SLASH
+    lambda v, p: v == "",                               # _KIND_EMPTY
+    lambda v, p: v != "",                               # _KIND_NONEMPTY
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -121,124 +241,237 @@ def _compile_pattern(token_or_literal: str) -> re.Pattern:
 #
 # For columns that hold dynamic data the special tokens above are used.
 # For columns that can be empty OR hold a datetime, use "ANY".
+#
+# Headers and rows may also be tuples.  Schemas shared by several exports
+# are defined once below as tuples and referenced by name, so the cloned
+# templates stay in step and share one object.
 # ─────────────────────────────────────────────────────────────────────────────
 
+# ── Shared schemas ───────────────────────────────────────────────────────────
+_CUSTOMER_HEADERS = (
+    "Created Date","ID","Customer Name","Reference Code","Partner Name",
+    "Trading As","Created By","Action Owner","Status","Contact Phone",
+    "Contact Name","Contact Email","KYC Completed At","Registered Country",
+    "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
+    "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
+    "Subscription Started At","Last Renewal At","Next Renewal At",
+    "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
+    "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
+    "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
+)
+_CUSTOMER_ROWS = ((
+    "DATETIME","INTEGER","MVSI PTY LTD","ANY","MVSI",
+    "MVSI PTY LTD","ANY","ANY","Active","ANY",
+    "ANY","ANY","DATETIME","Australia",
+    "ANY","ANY","ANY","ANY","MVSI PTY LTD",
+    "Australian Private Company","Yes","Yes","No",
+    "DATETIME","DATETIME","DATETIME",
+    "DATETIME","DATETIME","Pass","Customer",
+    "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
+),)
+_CUSTOMER_MAINTENANCE_ROWS = ((
+    "DATETIME","INTEGER","ANY","ANY","ANY",
+    "ANY","ANY","ANY","Active","ANY",
+    "ANY","ANY","DATETIME","Australia",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","Yes","Yes","No",
+    "DATETIME","DATETIME","DATETIME",
+    "ANY","DATETIME","ANY","Customer",
+    "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
+),)
+
+_INDIVIDUAL_RELATIONSHIP_HEADERS = (
+    "Created Date","Individual ID","Full Name","Email Address",
+    "Date of Birth","Gender","Partner Name","Phone Number",
+    "PEP/Sanctions?","Countries of Citizenship","Residential Address",
+    "Verified","Organisation ID","Organisation Name","Relationship",
+    "Subscription Started At","Last Renewal At","Next Renewal At",
+    "OCDD Last Run","OCDD Next Run","Action Owner",
+)
+_INDIVIDUAL_RELATIONSHIP_ROWS = ((
+    "DATETIME","INTEGER","ANY","ANY",
+    "DATE_SLASH","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","INTEGER","ANY","ANY",
+    "DATETIME","DATETIME","DATETIME",
+    "ANY","ANY","ANY",
+),)
+
+_INDIVIDUAL_HEADERS = (
+    "Created Date","Individual ID","Full Name","Email Address",
+    "Date of Birth","Gender","Partner Name","Phone Number",
+    "PEP/Sanctions?","Countries of Citizenship","Residential Address",
+    "Verified","Subscription Started At","Last Renewal At",
+    "Next Renewal At","OCDD Last Run","OCDD Next Run","Action Owner",
+)
+_INDIVIDUAL_ROWS = ((
+    "DATETIME","INTEGER","ANY","ANY",
+    "DATE_SLASH","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","DATETIME","DATETIME",
+    "DATETIME","ANY","ANY","ANY",
+),)
+
+_DATA_SOURCE_HEADERS = ("Data Source ID","Name","Description","Last Modified At","Created At")
+
+_COMMUNICATION_HEADERS = (
+    "Created Date","Label","Description","Package ID","Package",
+    "Verification Workflow ID","Verification Workflow","Partner ID",
+    "Partner","Type","Disabled",
+)
+
+_OFFER_HEADERS = (
+    "Created Date","Offer ID","Package","Customer ID",
+    "Customer Organisation Name","Sales Owner","Action Owner",
+    "Company Name","Contact Name","Contact Email","Contact Number",
+    "Customer Reference","Organisation Nickname","Individual Nickname",
+    "Stage","Status","On Hold","Last Actioned By","Completed By",
+    "Legal Entity Name","ABN","ACN","Registration Number",
+    "UK Company Number","Avg Card Ticket Size","Annual Turnover",
+    "Annual CC Turnover","Terminals QTY","Ecommerce (Y/N)",
+    "Primary Partner","Billing Partner","Locale","Last Note Date",
+    "Last Note Content","Waiting for Documents","Terminals (Y/N)",
+    "Ecommerce (Y/N)","Offer - Started at","Offer - Completed at",
+    "Customer Forms - Started at","Customer Forms - Completed at",
+    "KYC Verification - Started at","KYC Verification - Completed at",
+    "Underwriting - Started at","Underwriting - Completed at",
+    "Finalisation - Started at","Finalisation - Completed at",
+)
+_OFFER_ROWS = ((
+    "DATETIME","INTEGER","ANY","INTEGER",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+),)
+
+_OFFER_TAG_HEADERS = _OFFER_HEADERS + ("TAG-v4.54.3 system tag",)
+_OFFER_TAG_ROWS = ((
+    "DATETIME","INTEGER","ANY","INTEGER",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+    "ANY","ANY",
+    "ANY",
+),)
+
+_ORGANISATION_HEADERS = (
+    "Created Date","Organisation ID","Organisation Name","Reference Code",
+    "Partner Name","Trading As","Created By","Action Owner","Status",
+    "Contact Phone","Contact Name","Contact Email","KYC Completed At",
+    "Registered Country","Registration Number","ABN","ACN",
+    "UK Company Number","Legal Entity Name","Entity Type","Verified",
+    "OCDD Enabled","Has PEP/Sanctions?","Subscription Started At",
+    "Last Renewal At","Next Renewal At","OCDD Last Run","OCDD Next Run",
+    "Last OCDD Outcome","Relationship","OCDD Workflows","Risk Classes",
+    "RECORD-Country?","RECORD-This is a test",
+)
+_ORGANISATION_ROWS = ((
+    "DATETIME","INTEGER","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY",
+),)
+
+_PROSPECT_HEADERS = (
+    "Created Date","ID","Customer Name","Reference Code","Partner Name",
+    "Trading As","Created By","Action Owner","Status","Contact Phone",
+    "Contact Name","Contact Email","KYC Completed At","Registered Country",
+    "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
+    "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
+    "Subscription Started At","Last Renewal At","Next Renewal At",
+    "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
+    "OCDD Workflows","Risk Classes","RECORD-Country?","RECORD-This is a test",
+)
+_PROSPECT_ROWS = ((
+    "DATETIME","INTEGER","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","Prospect",
+    "ANY","ANY","ANY","ANY",
+),)
+
+_VERIFICATION_HEADERS = (
+    "Instantiated Date","Created Date","Verification ID","Entity Name",
+    "Verifier Name","Secondary Verifier Names","Partner Name","Offer Name",
+    "Offer Reference Code","Verification Workflow","Closed At",
+    "Person Name","Closed Reason","Closed By","Locked By","Status",
+    "Outcome","Action Owner","Offer On Hold","Reverification",
+    "Billing Partner","Verification Type","Waiting for Documents",
+    "Last Note Date","Last Note Content",
+)
+_VERIFICATION_ROWS = ((
+    "DATETIME","DATETIME","INTEGER","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY","ANY",
+    "ANY","ANY","ANY",
+    "ANY","ANY",
+),)
+
 REFERENCE_FILES = {
     # ── Customer ─────────────────────────────────────────────────────────
     "Customer/Customer barebone.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","MVSI PTY LTD","ANY","MVSI",
-            "MVSI PTY LTD","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","MVSI PTY LTD",
-            "Australian Private Company","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "DATETIME","DATETIME","Pass","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_ROWS,
     },
     "Customer/Customer Tags.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","MVSI PTY LTD","ANY","MVSI",
-            "MVSI PTY LTD","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","MVSI PTY LTD",
-            "Australian Private Company","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "DATETIME","DATETIME","Pass","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_ROWS,
     },
 
     # ── Individuals ──────────────────────────────────────────────────────
     "Individuals/Individual Details - tags.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Organisation ID","Organisation Name","Relationship",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","INTEGER","ANY","ANY",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_RELATIONSHIP_HEADERS,
+        "rows": _INDIVIDUAL_RELATIONSHIP_ROWS,
     },
     "Individuals/Individual Details -Individuals and relationships.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Organisation ID","Organisation Name","Relationship",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","INTEGER","ANY","ANY",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_RELATIONSHIP_HEADERS,
+        "rows": _INDIVIDUAL_RELATIONSHIP_ROWS,
     },
     "Individuals/Individual Details Individuals.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Subscription Started At","Last Renewal At",
-            "Next Renewal At","OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","DATETIME","DATETIME",
-            "DATETIME","ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_HEADERS,
+        "rows": _INDIVIDUAL_ROWS,
     },
 
     # ── My company Configuration Data sources ────────────────────────────
     "My company Configuration Data sources/External Data Source Details - barebone.csv": {
-        "headers": ["Data Source ID","Name","Description","Last Modified At","Created At"],
+        "headers": _DATA_SOURCE_HEADERS,
         "rows": [["INTEGER","New Data Source","ANY","DATETIME","DATETIME"]],
     },
 
     # ── My company Configuration System Templates ────────────────────────
     "My company Configuration System Templates/Communication Details - barebone.csv": {
-        "headers": [
-            "Created Date","Label","Description","Package ID","Package",
-            "Verification Workflow ID","Verification Workflow","Partner ID",
-            "Partner","Type","Disabled",
-        ],
+        "headers": _COMMUNICATION_HEADERS,
         # This file has 48 data rows – we validate headers + row count only
         # because the rows are static config and don't change between runs.
         # Use "ANY" for every cell so format is validated but content is flexible.
@@ -248,56 +481,18 @@ REFERENCE_FILES = {
 
     # ── My company Configuration System sources ──────────────────────────
     "My company Configuration System sources/External Data Source Details - barebone.csv": {
-        "headers": ["Data Source ID","Name","Description","Last Modified At","Created At"],
+        "headers": _DATA_SOURCE_HEADERS,
         "rows": [["INTEGER","New Internal Data Source","ANY","DATETIME","DATETIME"]],
     },
 
     # ── My company Portfolio Risk Customer Maintenance ────────────────────
     "My company Portfolio Risk Customer Maintenance/Customer Details - Tags.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY","ANY",
-            "ANY","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","DATETIME","ANY","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_MAINTENANCE_ROWS,
     },
     "My company Portfolio Risk Customer Maintenance/Customer Details - barebone.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY","ANY",
-            "ANY","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","DATETIME","ANY","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_MAINTENANCE_ROWS,
     },
 
     # ── My company Portfolio Risk OCDD Workflows ─────────────────────────
@@ -314,72 +509,20 @@ REFERENCE_FILES = {
 
     # ── My company Portfolio Risk Related Individuals ─────────────────────
     "My company Portfolio Risk Related Individuals/Individual Details - individual and relationship.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Organisation ID","Organisation Name","Relationship",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","INTEGER","ANY","ANY",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_RELATIONSHIP_HEADERS,
+        "rows": _INDIVIDUAL_RELATIONSHIP_ROWS,
     },
     "My company Portfolio Risk Related Individuals/Individual Details - individuals and relationshiop tags.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Organisation ID","Organisation Name","Relationship",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","INTEGER","ANY","ANY",
-            "DATETIME","DATETIME","DATETIME",
-            "ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_RELATIONSHIP_HEADERS,
+        "rows": _INDIVIDUAL_RELATIONSHIP_ROWS,
     },
     "My company Portfolio Risk Related Individuals/Individual Details - individuals tag.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Subscription Started At","Last Renewal At",
-            "Next Renewal At","OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","DATETIME","DATETIME",
-            "DATETIME","ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_HEADERS,
+        "rows": _INDIVIDUAL_ROWS,
     },
     "My company Portfolio Risk Related Individuals/Individual Details - individuals.csv": {
-        "headers": [
-            "Created Date","Individual ID","Full Name","Email Address",
-            "Date of Birth","Gender","Partner Name","Phone Number",
-            "PEP/Sanctions?","Countries of Citizenship","Residential Address",
-            "Verified","Subscription Started At","Last Renewal At",
-            "Next Renewal At","OCDD Last Run","OCDD Next Run","Action Owner",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "DATE_SLASH","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","DATETIME","DATETIME",
-            "DATETIME","ANY","ANY","ANY",
-        ]],
+        "headers": _INDIVIDUAL_HEADERS,
+        "rows": _INDIVIDUAL_ROWS,
     },
 
     # ── My company Portfolio Risk Risk Classes ────────────────────────────
@@ -396,11 +539,7 @@ REFERENCE_FILES = {
 
     # ── My company Regulatory & Legal Contacts ───────────────────────────
     "My company Regulatory & Legal Contacts/Communication Details - barebone.csv": {
-        "headers": [
-            "Created Date","Label","Description","Package ID","Package",
-            "Verification Workflow ID","Verification Workflow","Partner ID",
-            "Partner","Type","Disabled",
-        ],
+        "headers": _COMMUNICATION_HEADERS,
         "rows": [[
             "DATETIME","ANY","ANY","ANY","ANY",
             "ANY","ANY","INTEGER","MVSI","ANY","ANY",
@@ -451,202 +590,30 @@ REFERENCE_FILES = {
 
     # ── Offer ────────────────────────────────────────────────────────────
     "Offer/Offer - barebone.csv": {
-        "headers": [
-            "Created Date","Offer ID","Package","Customer ID",
-            "Customer Organisation Name","Sales Owner","Action Owner",
-            "Company Name","Contact Name","Contact Email","Contact Number",
-            "Customer Reference","Organisation Nickname","Individual Nickname",
-            "Stage","Status","On Hold","Last Actioned By","Completed By",
-            "Legal Entity Name","ABN","ACN","Registration Number",
-            "UK Company Number","Avg Card Ticket Size","Annual Turnover",
-            "Annual CC Turnover","Terminals QTY","Ecommerce (Y/N)",
-            "Primary Partner","Billing Partner","Locale","Last Note Date",
-            "Last Note Content","Waiting for Documents","Terminals (Y/N)",
-            "Ecommerce (Y/N)","Offer - Started at","Offer - Completed at",
-            "Customer Forms - Started at","Customer Forms - Completed at",
-            "KYC Verification - Started at","KYC Verification - Completed at",
-            "Underwriting - Started at","Underwriting - Completed at",
-            "Finalisation - Started at","Finalisation - Completed at",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","INTEGER",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _OFFER_HEADERS,
+        "rows": _OFFER_ROWS,
     },
     "Offer/Offer - Tags.csv": {
-        "headers": [
-            "Created Date","Offer ID","Package","Customer ID",
-            "Customer Organisation Name","Sales Owner","Action Owner",
-            "Company Name","Contact Name","Contact Email","Contact Number",
-            "Customer Reference","Organisation Nickname","Individual Nickname",
-            "Stage","Status","On Hold","Last Actioned By","Completed By",
-            "Legal Entity Name","ABN","ACN","Registration Number",
-            "UK Company Number","Avg Card Ticket Size","Annual Turnover",
-            "Annual CC Turnover","Terminals QTY","Ecommerce (Y/N)",
-            "Primary Partner","Billing Partner","Locale","Last Note Date",
-            "Last Note Content","Waiting for Documents","Terminals (Y/N)",
-            "Ecommerce (Y/N)","Offer - Started at","Offer - Completed at",
-            "Customer Forms - Started at","Customer Forms - Completed at",
-            "KYC Verification - Started at","KYC Verification - Completed at",
-            "Underwriting - Started at","Underwriting - Completed at",
-            "Finalisation - Started at","Finalisation - Completed at",
-            "TAG-v4.54.3 system tag",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","INTEGER",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY",
-        ]],
+        "headers": _OFFER_TAG_HEADERS,
+        "rows": _OFFER_TAG_ROWS,
     },
     "Offer/Offer - NoteCategories.csv": {
-        "headers": [
-            "Created Date","Offer ID","Package","Customer ID",
-            "Customer Organisation Name","Sales Owner","Action Owner",
-            "Company Name","Contact Name","Contact Email","Contact Number",
-            "Customer Reference","Organisation Nickname","Individual Nickname",
-            "Stage","Status","On Hold","Last Actioned By","Completed By",
-            "Legal Entity Name","ABN","ACN","Registration Number",
-            "UK Company Number","Avg Card Ticket Size","Annual Turnover",
-            "Annual CC Turnover","Terminals QTY","Ecommerce (Y/N)",
-            "Primary Partner","Billing Partner","Locale","Last Note Date",
-            "Last Note Content","Waiting for Documents","Terminals (Y/N)",
-            "Ecommerce (Y/N)","Offer - Started at","Offer - Completed at",
-            "Customer Forms - Started at","Customer Forms - Completed at",
-            "KYC Verification - Started at","KYC Verification - Completed at",
-            "Underwriting - Started at","Underwriting - Completed at",
-            "Finalisation - Started at","Finalisation - Completed at",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","INTEGER",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _OFFER_HEADERS,
+        "rows": _OFFER_ROWS,
     },
     "Offer/Offer - TagsNoteCategories.csv": {
-        "headers": [
-            "Created Date","Offer ID","Package","Customer ID",
-            "Customer Organisation Name","Sales Owner","Action Owner",
-            "Company Name","Contact Name","Contact Email","Contact Number",
-            "Customer Reference","Organisation Nickname","Individual Nickname",
-            "Stage","Status","On Hold","Last Actioned By","Completed By",
-            "Legal Entity Name","ABN","ACN","Registration Number",
-            "UK Company Number","Avg Card Ticket Size","Annual Turnover",
-            "Annual CC Turnover","Terminals QTY","Ecommerce (Y/N)",
-            "Primary Partner","Billing Partner","Locale","Last Note Date",
-            "Last Note Content","Waiting for Documents","Terminals (Y/N)",
-            "Ecommerce (Y/N)","Offer - Started at","Offer - Completed at",
-            "Customer Forms - Started at","Customer Forms - Completed at",
-            "KYC Verification - Started at","KYC Verification - Completed at",
-            "Underwriting - Started at","Underwriting - Completed at",
-            "Finalisation - Started at","Finalisation - Completed at",
-            "TAG-v4.54.3 system tag",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","INTEGER",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY","ANY",
-            "ANY",
-        ]],
+        "headers": _OFFER_TAG_HEADERS,
+        "rows": _OFFER_TAG_ROWS,
     },
 
     # ── Organisations ────────────────────────────────────────────────────
     "Organisations/Organisation Details - barebone.csv": {
-        "headers": [
-            "Created Date","Organisation ID","Organisation Name","Reference Code",
-            "Partner Name","Trading As","Created By","Action Owner","Status",
-            "Contact Phone","Contact Name","Contact Email","KYC Completed At",
-            "Registered Country","Registration Number","ABN","ACN",
-            "UK Company Number","Legal Entity Name","Entity Type","Verified",
-            "OCDD Enabled","Has PEP/Sanctions?","Subscription Started At",
-            "Last Renewal At","Next Renewal At","OCDD Last Run","OCDD Next Run",
-            "Last OCDD Outcome","Relationship","OCDD Workflows","Risk Classes",
-            "RECORD-Country?","RECORD-This is a test",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _ORGANISATION_HEADERS,
+        "rows": _ORGANISATION_ROWS,
     },
     "Organisations/Organisation Details - Tags.csv": {
-        "headers": [
-            "Created Date","Organisation ID","Organisation Name","Reference Code",
-            "Partner Name","Trading As","Created By","Action Owner","Status",
-            "Contact Phone","Contact Name","Contact Email","KYC Completed At",
-            "Registered Country","Registration Number","ABN","ACN",
-            "UK Company Number","Legal Entity Name","Entity Type","Verified",
-            "OCDD Enabled","Has PEP/Sanctions?","Subscription Started At",
-            "Last Renewal At","Next Renewal At","OCDD Last Run","OCDD Next Run",
-            "Last OCDD Outcome","Relationship","OCDD Workflows","Risk Classes",
-            "RECORD-Country?","RECORD-This is a test",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _ORGANISATION_HEADERS,
+        "rows": _ORGANISATION_ROWS,
     },
 
     # ── Partners ─────────────────────────────────────────────────────────
@@ -657,96 +624,22 @@ REFERENCE_FILES = {
 
     # ── Prospects ────────────────────────────────────────────────────────
     "Prospects/Prospect barebone.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Country?","RECORD-This is a test",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","Prospect",
-            "ANY","ANY","ANY","ANY",
-        ]],
+        "headers": _PROSPECT_HEADERS,
+        "rows": _PROSPECT_ROWS,
     },
     "Prospects/Prospect Tags.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Country?","RECORD-This is a test",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","Prospect",
-            "ANY","ANY","ANY","ANY",
-        ]],
+        "headers": _PROSPECT_HEADERS,
+        "rows": _PROSPECT_ROWS,
     },
 
     # ── Underwriting ActionOwners ────────────────────────────────────────
     "Underwriting ActionOwners/Customer_Prospect Details barebone.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","MVSI PTY LTD","ANY","MVSI",
-            "MVSI PTY LTD","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","MVSI PTY LTD",
-            "Australian Private Company","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "DATETIME","DATETIME","Pass","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_ROWS,
     },
     "Underwriting ActionOwners/Customer_Prospect Details Tags.csv": {
-        "headers": [
-            "Created Date","ID","Customer Name","Reference Code","Partner Name",
-            "Trading As","Created By","Action Owner","Status","Contact Phone",
-            "Contact Name","Contact Email","KYC Completed At","Registered Country",
-            "Registration Number","ABN","ACN","UK Company Number","Legal Entity Name",
-            "Entity Type","Verified","OCDD Enabled","Has PEP/Sanctions?",
-            "Subscription Started At","Last Renewal At","Next Renewal At",
-            "OCDD Last Run","OCDD Next Run","Last OCDD Outcome","Relationship",
-            "OCDD Workflows","Risk Classes","RECORD-Annual Turnover",
-            "RECORD-Can you see this?","RECORD-Country?","RECORD-Field 1",
-        ],
-        "rows": [[
-            "DATETIME","INTEGER","MVSI PTY LTD","ANY","MVSI",
-            "MVSI PTY LTD","ANY","ANY","Active","ANY",
-            "ANY","ANY","DATETIME","Australia",
-            "ANY","ANY","ANY","ANY","MVSI PTY LTD",
-            "Australian Private Company","Yes","Yes","No",
-            "DATETIME","DATETIME","DATETIME",
-            "DATETIME","DATETIME","Pass","Customer",
-            "Low Risk","Low Risk","ANY","ANY","ANY","Testing",
-        ]],
+        "headers": _CUSTOMER_HEADERS,
+        "rows": _CUSTOMER_ROWS,
     },
 
     # ── Underwriting MyWork ──────────────────────────────────────────────
@@ -786,93 +679,182 @@ REFERENCE_FILES = {
 
     # ── Verifications ────────────────────────────────────────────────────
     "Verifications/Verification Details barebone.csv": {
-        "headers": [
-            "Instantiated Date","Created Date","Verification ID","Entity Name",
-            "Verifier Name","Secondary Verifier Names","Partner Name","Offer Name",
-            "Offer Reference Code","Verification Workflow","Closed At",
-            "Person Name","Closed Reason","Closed By","Locked By","Status",
-            "Outcome","Action Owner","Offer On Hold","Reverification",
-            "Billing Partner","Verification Type","Waiting for Documents",
-            "Last Note Date","Last Note Content",
-        ],
-        "rows": [[
-            "DATETIME","DATETIME","INTEGER","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _VERIFICATION_HEADERS,
+        "rows": _VERIFICATION_ROWS,
     },
     "Verifications/Verification Details Entity Type Counters.csv": {
-        "headers": [
-            "Instantiated Date","Created Date","Verification ID","Entity Name",
-            "Verifier Name","Secondary Verifier Names","Partner Name","Offer Name",
-            "Offer Reference Code","Verification Workflow","Closed At",
-            "Person Name","Closed Reason","Closed By","Locked By","Status",
-            "Outcome","Action Owner","Offer On Hold","Reverification",
-            "Billing Partner","Verification Type","Waiting for Documents",
-            "Last Note Date","Last Note Content",
-        ],
-        "rows": [[
-            "DATETIME","DATETIME","INTEGER","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _VERIFICATION_HEADERS,
+        "rows": _VERIFICATION_ROWS,
     },
     "Verifications/Verification Details Note Categories.csv": {
-        "headers": [
-            "Instantiated Date","Created Date","Verification ID","Entity Name",
-            "Verifier Name","Secondary Verifier Names","Partner Name","Offer Name",
-            "Offer Reference Code","Verification Workflow","Closed At",
-            "Person Name","Closed Reason","Closed By","Locked By","Status",
-            "Outcome","Action Owner","Offer On Hold","Reverification",
-            "Billing Partner","Verification Type","Waiting for Documents",
-            "Last Note Date","Last Note Content",
-        ],
-        "rows": [[
-            "DATETIME","DATETIME","INTEGER","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _VERIFICATION_HEADERS,
+        "rows": _VERIFICATION_ROWS,
     },
     "Verifications/Verification Details Tags.csv": {
-        "headers": [
-            "Instantiated Date","Created Date","Verification ID","Entity Name",
-            "Verifier Name","Secondary Verifier Names","Partner Name","Offer Name",
-            "Offer Reference Code","Verification Workflow","Closed At",
-            "Person Name","Closed Reason","Closed By","Locked By","Status",
-            "Outcome","Action Owner","Offer On Hold","Reverification",
-            "Billing Partner","Verification Type","Waiting for Documents",
-            "Last Note Date","Last Note Content",
-        ],
-        "rows": [[
-            "DATETIME","DATETIME","INTEGER","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY","ANY",
-            "ANY","ANY","ANY",
-            "ANY","ANY",
-        ]],
+        "headers": _VERIFICATION_HEADERS,
+        "rows": _VERIFICATION_ROWS,
     },
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _RefEntry:
+    """One REFERENCE_FILES entry, frozen and with its cell specs compiled."""
+    name: str                                       # relative path of the file
+    headers: tuple[str, ...]
+    tokens: Optional[tuple[tuple[str, ...], ...]]   # None → no per-cell rules
+    rows: Optional[tuple[tuple[array, tuple], ...]] # (kinds, payloads) per row
+    col_names: Optional[tuple[str, ...]] = None     # diagnostic name per spec column
+    check_all: Optional[Callable[[list[list[str]]], bool]] = None  # whole-file fast path
+    expected_row_count: Optional[int] = None
+    min_row_count: Optional[int] = None
+
+
+def _row_check_expr(kinds: array, payloads: tuple, namespace: dict,
+                    tag: str) -> Optional[str]:
+    """Return a boolean expression over ``row`` for one row spec, or None if
+    every column is ANY.
+
+    Date cells are joined with \x1f and matched by one regex, stored in
+    *namespace* under a name suffixed with *tag*.
+    """
+    terms = []
+    joined_cells = []
+    joined_patterns = []
+    width = 0
+    for col_idx, (kind, payload) in enumerate(zip(kinds, payloads)):
+        if kind == _KIND_ANY:
+            continue
+        cell = f"row[{col_idx}].strip()"
+        if kind == _KIND_LITERAL:
+            terms.append(f"{cell} == {payload!r}")
+        elif kind == _KIND_DATETIME:
+            joined_cells.append(cell)
+            joined_patterns.append(_DATETIME_RE)
+        elif kind == _KIND_INTEGER:
+            terms.append(f"{cell}.isdecimal()")
+        elif kind == _KIND_DATE_SLASH:
+            joined_cells.append(cell)
+            joined_patterns.append(_DATE_SLASH_RE)
+        elif kind == _KIND_EMPTY:
+            terms.append(f"{cell} == ''")
+        else:  # _KIND_NONEMPTY
+            terms.append(f"{cell} != ''")
+        width = col_idx + 1
+    if joined_cells:
+        row_re = f"_row_re{tag}"
+        namespace[row_re] = re.compile("\x1f".join(joined_patterns)).fullmatch
+        if len(joined_cells) == 1:
+            terms.append(f"{row_re}({joined_cells[0]}) is not None")
+        else:
+            terms.append(f"{row_re}('\\x1f'.join(({', '.join(joined_cells)}))) is not None")
+    if not terms:
+        return None
+    return f"len(row) >= {width} and {' and '.join(terms)}"
+
+
+def _build_schema_check(rows: tuple[tuple[array, tuple], ...]
+                        ) -> Callable[[list[list[str]]], bool]:
+    """Generate ``check(data)``: True if every spec row is present and matches.
+
+    The function is straight-line code built from each row's
+    _row_check_expr.
+    """
+    namespace: dict = {}
+    lines = [
+        "def check(data):",
+        f"    if len(data) < {len(rows)}:",
+        "        return False",
+    ]
+    for row_idx, (kinds, payloads) in enumerate(rows):
+        expr = _row_check_expr(kinds, payloads, namespace, f"{row_idx}_")
+        if expr is None:
+            continue
+        lines += [
+            f"    row = data[{row_idx}]",
+            f"    if not ({expr}):",
+            "        return False",
+        ]
+    lines.append("    return True\n")
+    exec(compile("\n".join(lines), "<schema check>", "exec"), namespace)
+    return namespace["check"]
+
+
+def _precompile_references(references: dict) -> tuple[_RefEntry, ...]:
+    """Freeze *references* into a tuple of _RefEntry, compiling cell specs.
+
+    Compiled rows and schema checks are shared between references with
+    identical specs, and names, tokens and literals are interned.
+    """
+    table = []
+    row_cache: dict[tuple[str, ...], tuple] = {}
+    schema_cache: dict[tuple[tuple[str, ...], ...], Callable[[list[list[str]]], bool]] = {}
+    for rel_path, ref in references.items():
+        row_patterns = ref.get("rows")
+        headers = tuple(map(sys.intern, ref["headers"]))
+        tokens = rows = col_names = check_all = None
+        if row_patterns != "ANY_ROWS" and row_patterns is not None:
+            tokens = tuple(tuple(map(sys.intern, row)) for row in row_patterns)
+            compiled = []
+            for key in tokens:
+                compiled_row = row_cache.get(key)
+                if compiled_row is None:
+                    specs = [_compile_pattern(tok) for tok in key]
+                    compiled_row = row_cache[key] = (
+                        array("b", [kind for kind, _ in specs]),
+                        tuple(payload for _, payload in specs),
+                    )
+                compiled.append(compiled_row)
+            rows = tuple(compiled)
+            check_all = schema_cache.get(tokens)
+            if check_all is None:
+                check_all = schema_cache[tokens] = _build_schema_check(rows)
+            width = max(map(len, tokens), default=0)
+            col_names = headers[:width] + tuple(
+                f"col_{i}" for i in range(len(headers), width)
+            )
+        table.append(_RefEntry(
+            name=rel_path,
+            headers=headers,
+            tokens=tokens,
+            rows=rows,
+            col_names=col_names,
+            check_all=check_all,
+            expected_row_count=ref.get("expected_row_count"),
+            min_row_count=ref.get("min_row_count"),
+        ))
+    return tuple(table)
+
+
+@functools.cache
+def _get_ref_table() -> tuple[_RefEntry, ...]:
+    """Return REFERENCE_FILES precompiled, building it on first use.
+
+    Deferred so that importing the module, or exiting early on a bad
+    directory argument, doesn't pay for compiling every reference.
+    """
+    return _precompile_references(REFERENCE_FILES)
+
+
+@functools.cache
+def _get_header_index() -> dict[tuple[str, ...], int]:
+    """Return header tuple → index of the first reference entry using it.
+
+    Lets a file whose headers don't match its own reference be traced to
+    the template it does match (e.g. two exports saved under each other's
+    names).
+    """
+    index: dict[tuple[str, ...], int] = {}
+    for idx, entry in enumerate(_get_ref_table()):
+        index.setdefault(entry.headers, idx)
+    return index
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Result data classes
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class FileResult:
     """Verification result for a single file."""
     relative_path: str
@@ -893,39 +875,40 @@ class FileResult:
 # Core verification logic
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _read_csv(filepath: Path) -> tuple[list[str], list[list[str]]]:
+def _read_csv(filepath: str) -> tuple[list[str], list[list[str]]]:
     """Read a CSV and return (headers, data_rows)."""
-    with open(filepath, "r", newline="", encoding="utf-8-sig") as fh:
-        text = fh.read()
-    # Normalise line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    reader = csv.reader(io.StringIO(text))
-    rows = list(reader)
-    if not rows:
+    # Empty exports are common; skip the open and decoder setup for them.
+    if os.stat(filepath).st_size == 0:
         return [], []
-    headers = [h.strip() for h in rows[0]]
-    data = rows[1:]
+    # With newline="", csv.reader handles \r\n / \r record endings and keeps
+    # line endings inside quoted fields as they are.  The raw file is read
+    # through a 1 MiB buffer to cut read calls on large exports.
+    with open(filepath, "rb", buffering=1 << 20) as raw, \
+            io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as fh:
+        reader = csv.reader(fh)
+        header_row = next(reader, None)
+        if header_row is None:
+            return [], []
+        headers = [h.strip() for h in header_row]
+        data = list(reader)
     return headers, data
 
 
-def verify_file(base_dir: Path, rel_path: str, ref: dict) -> FileResult:
-    """Verify one downloaded file against its reference definition."""
-    result = FileResult(relative_path=rel_path)
-    filepath = base_dir / rel_path
-
-    if not filepath.exists():
-        result.status = "MISSING"
-        return result
-
-    headers, data_rows = _read_csv(filepath)
+def verify_parsed(entry: _RefEntry, headers: list[str],
+                  data_rows: list[list[str]]) -> FileResult:
+    """Verify one already-parsed file against its reference definition."""
+    result = FileResult(relative_path=entry.name)
 
     # ── Header check ─────────────────────────────────────────────────────
-    expected_headers = ref["headers"]
-    if headers != expected_headers:
+    expected_headers = entry.headers
+    actual_headers = tuple(headers)
+    if actual_headers != expected_headers:
         result.header_ok = False
         result.status = "FAIL"
-        missing_h = [h for h in expected_headers if h not in headers]
-        extra_h = [h for h in headers if h not in expected_headers]
+        expected_set = set(expected_headers)
+        actual_set = set(headers)
+        missing_h = [h for h in expected_headers if h not in actual_set]
+        extra_h = [h for h in headers if h not in expected_set]
         parts = []
         if missing_h:
             parts.append(f"missing columns: {missing_h}")
@@ -933,11 +916,14 @@ def verify_file(base_dir: Path, rel_path: str, ref: dict) -> FileResult:
             parts.append(f"extra columns: {extra_h}")
         if not missing_h and not extra_h:
             parts.append("column order differs")
+        idx = _get_header_index().get(actual_headers)
+        if idx is not None:
+            parts.append(f"headers match reference '{_get_ref_table()[idx].name}'")
         result.header_details = "; ".join(parts)
 
     # ── Row-count check ──────────────────────────────────────────────────
-    expected_count = ref.get("expected_row_count")
-    min_count = ref.get("min_row_count")
+    expected_count = entry.expected_row_count
+    min_count = entry.min_row_count
     if expected_count is not None and len(data_rows) != expected_count:
         result.row_count_ok = False
         result.status = "FAIL"
@@ -952,90 +938,136 @@ def verify_file(base_dir: Path, rel_path: str, ref: dict) -> FileResult:
         )
 
     # ── Cell-level checks ────────────────────────────────────────────────
-    row_patterns = ref.get("rows")
-    if row_patterns == "ANY_ROWS" or row_patterns is None:
+    if entry.rows is None:
         return result  # nothing more to check
-
-    for row_idx, expected_row in enumerate(row_patterns):
+    if entry.check_all(data_rows):
+        return result  # every spec row present and matching
+
+    col_names = entry.col_names
+    add_issue = result.cell_issues.append
+    # check_all failed: walk the specs to find out which cells are wrong
+    specs = zip(entry.tokens, entry.rows)
+    for row_idx, (expected_row, (kinds, payloads)) in enumerate(specs):
         if row_idx >= len(data_rows):
-            result.cell_issues.append(f"Row {row_idx+1}: row missing from file")
+            add_issue(f"Row {row_idx+1}: row missing from file")
             result.status = "FAIL"
             continue
         actual_row = data_rows[row_idx]
-        for col_idx, pattern_token in enumerate(expected_row):
-            col_name = expected_headers[col_idx] if col_idx < len(expected_headers) else f"col_{col_idx}"
+        for col_idx, (kind, payload) in enumerate(zip(kinds, payloads)):
+            if kind == _KIND_ANY:
+                continue
             actual_val = actual_row[col_idx].strip() if col_idx < len(actual_row) else ""
-            pat = _compile_pattern(pattern_token)
-            if not pat.match(actual_val):
-                result.cell_issues.append(
-                    f"Row {row_idx+1}, [{col_name}]: "
-                    f"expected pattern '{pattern_token}' but got '{actual_val[:80]}'"
+            if not _KIND_CHECKS[kind](actual_val, payload):
+                add_issue(
+                    f"Row {row_idx+1}, [{col_names[col_idx]}]: "
+                    f"expected pattern '{expected_row[col_idx]}' but got '{actual_val[:80]}'"
                 )
                 result.status = "FAIL"
 
     return result
 
 
-def scan_placeholders(base_dir: Path, results: list[FileResult]) -> int:
-    """Scan every CSV file for placeholder / pseudo-blank values.
+def scan_placeholders(headers: list[str], data_rows: list[list[str]],
+                      result: FileResult) -> None:
+    """Scan one parsed file for placeholder / pseudo-blank values.
+
+    Appends to ``result.placeholder_issues``.
+    """
+    add_issue = result.placeholder_issues.append
+    search_row = _ROW_PLACEHOLDER_RE.search
+    for row_idx, row in enumerate(data_rows):
+        joined = "\x1f" + "\x1f".join(row)
+        if (joined.isascii() and joined.count("\x1f") == len(row)
+                and "[object " not in joined
+                and search_row(joined) is None):
+            continue
+        for col_idx, raw_val in enumerate(row):
+            reason = _placeholder_reason(raw_val)
+            if reason is not None:
+                col_name = headers[col_idx] if col_idx < len(headers) else f"col_{col_idx}"
+                add_issue(
+                    f"Row {row_idx+1}, [{col_name}]: "
+                    f"\"{raw_val.strip()[:60]}\" — {reason}"
+                )
+
 
-    Mutates each FileResult in *results* by appending to its
-    ``placeholder_issues`` list.  Returns the total count of issues found.
+def verify_and_scan(base_dir: Path, rel_path: str,
+                    entry: Optional[_RefEntry]) -> FileResult:
+    """Check one file found by the walk, reading it exactly once.
+
+    *entry* is the file's reference definition, or None for a file that
+    isn't in the reference set.  The same parse feeds both the reference
+    checks and the placeholder scan.
     """
-    total = 0
-    # Build a lookup by relative path for quick access
-    result_map: dict[str, FileResult] = {r.relative_path: r for r in results}
+    headers, data_rows = _read_csv(os.path.join(base_dir, rel_path))
+    if entry is None:
+        result = FileResult(relative_path=rel_path, status="UNEXPECTED")
+    else:
+        result = verify_parsed(entry, headers, data_rows)
+    scan_placeholders(headers, data_rows, result)
+    return result
 
-    for root, _dirs, files in os.walk(base_dir):
-        for f in files:
-            if not f.lower().endswith(".csv"):
-                continue
-            filepath = Path(root) / f
-            rel = str(filepath.relative_to(base_dir))
-            headers, data_rows = _read_csv(filepath)
-            for row_idx, row in enumerate(data_rows):
-                for col_idx, raw_val in enumerate(row):
-                    col_name = headers[col_idx] if col_idx < len(headers) else f"col_{col_idx}"
-                    for pattern, reason in PLACEHOLDER_PATTERNS:
-                        if pattern.search(raw_val):
-                            msg = (
-                                f"Row {row_idx+1}, [{col_name}]: "
-                                f"\"{raw_val.strip()[:60]}\" — {reason}"
-                            )
-                            if rel in result_map:
-                                result_map[rel].placeholder_issues.append(msg)
-                            else:
-                                # File is unexpected; create a transient result
-                                fr = FileResult(relative_path=rel, status="UNEXPECTED")
-                                fr.placeholder_issues.append(msg)
-                                results.append(fr)
-                                result_map[rel] = fr
-                            total += 1
-                            break  # one match per cell is enough
-    return total
+
+def _iter_csvs(base_dir: Path) -> Iterator[str]:
+    """Yield the path of every CSV file under *base_dir*.
+
+    Uses os.scandir directly: each DirEntry already knows whether it is a
+    directory, so no extra stat is needed per file.  Like os.walk, symlinked
+    directories are not descended into and unreadable directories are
+    skipped.
+    """
+    stack = [os.fspath(base_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(".csv"):
+                    yield entry.path
 
 
 def discover_actual_files(base_dir: Path) -> set[str]:
-    """Walk the base_dir and return all CSV relative paths."""
-    found = set()
-    for root, _dirs, files in os.walk(base_dir):
-        for f in files:
-            if f.lower().endswith(".csv"):
-                full = Path(root) / f
-                found.add(str(full.relative_to(base_dir)))
-    return found
+    """Walk the base_dir and return all CSV relative paths.
+
+    Paths use "/" as the separator on every platform, matching the
+    REFERENCE_FILES keys.
+    """
+    # Every yielded path starts with base_dir plus a separator, so the
+    # relative path is a plain slice.
+    prefix_len = len(os.path.join(base_dir, ""))
+    return {
+        path[prefix_len:].replace(os.sep, "/") for path in _iter_csvs(base_dir)
+    }
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Pretty-print summary
 # ─────────────────────────────────────────────────────────────────────────────
 
-_BOLD   = "\033[1m"
-_RED    = "\033[91m"
-_GREEN  = "\033[92m"
-_YELLOW = "\033[93m"
-_CYAN   = "\033[96m"
-_RESET  = "\033[0m"
+# ANSI colours only when writing to a terminal; redirected output and CI
+# logs get plain text.
+_USE_COLOUR = sys.stdout.isatty()
+
+_BOLD    = "\033[1m"  if _USE_COLOUR else ""
+_RED     = "\033[91m" if _USE_COLOUR else ""
+_GREEN   = "\033[92m" if _USE_COLOUR else ""
+_YELLOW  = "\033[93m" if _USE_COLOUR else ""
+_CYAN    = "\033[96m" if _USE_COLOUR else ""
+_MAGENTA = "\033[95m" if _USE_COLOUR else ""
+_RESET   = "\033[0m"  if _USE_COLOUR else ""
+
+# Padding for a _colour() status cell: 13 visible characters plus the
+# escape codes around the status, which take up no columns.
+_STATUS_W = 13 + len(_GREEN) + len(_RESET)
 
 
 def _colour(status: str) -> str:
@@ -1045,14 +1077,18 @@ def _colour(status: str) -> str:
 
 def print_summary(results: list[FileResult], unexpected: list[str],
                   placeholder_count: int):
-    """Print a human-readable summary table."""
-    _MAGENTA = "\033[95m"
+    """Print a human-readable summary table.
 
-    print()
-    print(f"{_BOLD}{'=' * 100}{_RESET}")
-    print(f"{_BOLD}  EXPORTED FILE VERIFICATION SUMMARY{_RESET}")
-    print(f"{_BOLD}{'=' * 100}{_RESET}")
-    print()
+    Lines are collected and written in one call rather than printed one
+    at a time.
+    """
+    out: list[str] = []
+
+    out.append("")
+    out.append(f"{_BOLD}{'=' * 100}{_RESET}")
+    out.append(f"{_BOLD}  EXPORTED FILE VERIFICATION SUMMARY{_RESET}")
+    out.append(f"{_BOLD}{'=' * 100}{_RESET}")
+    out.append("")
 
     # ── Summary counts ───────────────────────────────────────────────────
     passed  = sum(1 for r in results if r.status == "PASS")
@@ -1061,13 +1097,13 @@ def print_summary(results: list[FileResult], unexpected: list[str],
     extra   = len(unexpected)
     files_with_placeholders = sum(1 for r in results if r.placeholder_issues)
 
-    print(f"  Total expected files : {len(results)}")
-    print(f"  {_GREEN}✓ Passed{_RESET}             : {passed}")
-    print(f"  {_RED}✗ Failed{_RESET}             : {failed}")
-    print(f"  {_YELLOW}⚠ Missing{_RESET}            : {missing}")
-    print(f"  {_CYAN}? Unexpected{_RESET}         : {extra}")
-    print(f"  {_MAGENTA}⊘ Placeholders{_RESET}       : {placeholder_count} value(s) across {files_with_placeholders} file(s)")
-    print()
+    out.append(f"  Total expected files : {len(results)}")
+    out.append(f"  {_GREEN}✓ Passed{_RESET}             : {passed}")
+    out.append(f"  {_RED}✗ Failed{_RESET}             : {failed}")
+    out.append(f"  {_YELLOW}⚠ Missing{_RESET}            : {missing}")
+    out.append(f"  {_CYAN}? Unexpected{_RESET}         : {extra}")
+    out.append(f"  {_MAGENTA}⊘ Placeholders{_RESET}       : {placeholder_count} value(s) across {files_with_placeholders} file(s)")
+    out.append("")
 
     # ── File-by-file table ───────────────────────────────────────────────
     col_w = max((len(r.relative_path) for r in results), default=40)
@@ -1075,8 +1111,8 @@ def print_summary(results: list[FileResult], unexpected: list[str],
     col_w = max(col_w, 40)
 
     header_line = f"  {'File':<{col_w}}  {'Status':<12}  Details"
-    print(f"{_BOLD}{header_line}{_RESET}")
-    print(f"  {'─' * col_w}  {'─' * 12}  {'─' * 40}")
+    out.append(f"{_BOLD}{header_line}{_RESET}")
+    out.append(f"  {'─' * col_w}  {'─' * 12}  {'─' * 40}")
 
     for r in sorted(results, key=lambda x: (x.status != "MISSING", x.status != "FAIL", x.relative_path)):
         details_parts = []
@@ -1089,59 +1125,66 @@ def print_summary(results: list[FileResult], unexpected: list[str],
         if r.placeholder_issues:
             details_parts.append(f"{_MAGENTA}{len(r.placeholder_issues)} placeholder(s){_RESET}")
         detail_str = "; ".join(details_parts) if details_parts else ""
-        print(f"  {r.relative_path:<{col_w}}  {_colour(r.status):<22}  {detail_str}")
+        out.append(f"  {r.relative_path:<{col_w}}  {_colour(r.status):<{_STATUS_W}}  {detail_str}")
 
     for u in sorted(unexpected):
-        print(f"  {u:<{col_w}}  {_colour('UNEXPECTED'):<22}  File not in reference set")
+        out.append(f"  {u:<{col_w}}  {_colour('UNEXPECTED'):<{_STATUS_W}}  File not in reference set")
 
-    print()
+    out.append("")
 
     # ── Detailed cell issues ─────────────────────────────────────────────
     any_issues = any(r.cell_issues for r in results)
     if any_issues:
-        print(f"{_BOLD}{'─' * 100}{_RESET}")
-        print(f"{_BOLD}  CELL-LEVEL ISSUES{_RESET}")
-        print(f"{_BOLD}{'─' * 100}{_RESET}")
+        out.append(f"{_BOLD}{'─' * 100}{_RESET}")
+        out.append(f"{_BOLD}  CELL-LEVEL ISSUES{_RESET}")
+        out.append(f"{_BOLD}{'─' * 100}{_RESET}")
         for r in results:
             if r.cell_issues:
-                print(f"\n  {_BOLD}{r.relative_path}{_RESET}")
+                out.append(f"\n  {_BOLD}{r.relative_path}{_RESET}")
                 for issue in r.cell_issues:
-                    print(f"    • {issue}")
-        print()
+                    out.append(f"    • {issue}")
+        out.append("")
 
     # ── Placeholder / pseudo-blank issues ────────────────────────────────
     if placeholder_count > 0:
-        print(f"{_BOLD}{'─' * 100}{_RESET}")
-        print(f"{_BOLD}{_MAGENTA}  PLACEHOLDER / PSEUDO-BLANK VALUES{_RESET}")
-        print(f"{_BOLD}{'─' * 100}{_RESET}")
-        print(f"  Values that are not real data — serialisation artefacts,")
-        print(f"  whitespace masquerading as blank, or programmatic nulls.")
+        out.append(f"{_BOLD}{'─' * 100}{_RESET}")
+        out.append(f"{_BOLD}{_MAGENTA}  PLACEHOLDER / PSEUDO-BLANK VALUES{_RESET}")
+        out.append(f"{_BOLD}{'─' * 100}{_RESET}")
+        out.append(f"  Values that are not real data — serialisation artefacts,")
+        out.append(f"  whitespace masquerading as blank, or programmatic nulls.")
         for r in results:
             if r.placeholder_issues:
-                print(f"\n  {_BOLD}{r.relative_path}{_RESET}")
+                out.append(f"\n  {_BOLD}{r.relative_path}{_RESET}")
                 for issue in r.placeholder_issues:
-                    print(f"    ⊘ {issue}")
-        print()
+                    out.append(f"    ⊘ {issue}")
+        out.append("")
 
     # ── Final verdict ────────────────────────────────────────────────────
-    print(f"{'=' * 100}")
+    out.append(f"{'=' * 100}")
     if failed == 0 and missing == 0 and extra == 0 and placeholder_count == 0:
-        print(f"  {_GREEN}{_BOLD}ALL CHECKS PASSED ✓{_RESET}")
+        out.append(f"  {_GREEN}{_BOLD}ALL CHECKS PASSED ✓{_RESET}")
     else:
         parts = []
         if failed > 0 or missing > 0 or extra > 0:
             parts.append(f"{_RED}{_BOLD}STRUCTURAL/CONTENT CHECKS FAILED{_RESET}")
         if placeholder_count > 0:
             parts.append(f"{_MAGENTA}{_BOLD}{placeholder_count} PLACEHOLDER VALUE(S) DETECTED{_RESET}")
-        print(f"  {' | '.join(parts)}")
-    print(f"{'=' * 100}")
-    print()
+        out.append(f"  {' | '.join(parts)}")
+    out.append(f"{'=' * 100}")
+    out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Main
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Batches smaller than this (total CSV bytes) are checked serially: for a
+# typical export, starting a thread pool costs more than it saves.
+_PARALLEL_MIN_BYTES = 4 << 20
+
+
 def main():
     if len(sys.argv) > 1:
         base_dir = Path(sys.argv[1])
@@ -1154,21 +1197,49 @@ def main():
 
     print(f"\nScanning: {base_dir.resolve()}\n")
 
-    # 1. Verify each expected file
-    results: list[FileResult] = []
-    for rel_path, ref in REFERENCE_FILES.items():
-        result = verify_file(base_dir, rel_path, ref)
-        results.append(result)
-
-    # 2. Detect unexpected files
-    expected_set = set(REFERENCE_FILES.keys())
+    # 1. Walk the tree once to find every CSV, and spot unexpected ones
+    ref_table = _get_ref_table()
+    expected_set = {entry.name for entry in ref_table}
     actual_set = discover_actual_files(base_dir)
     unexpected = sorted(actual_set - expected_set)
 
-    # 3. Scan for placeholder / pseudo-blank values
-    placeholder_count = scan_placeholders(base_dir, results)
-
-    # 4. Print summary
+    # 2. Check every file – verify expected ones against their reference and
+    #    scan all of them for placeholder values.  Files are independent and
+    #    mostly I/O and C-level parsing, so large batches are spread over a
+    #    thread pool; each file is parsed once.  An expected file the walk
+    #    didn't find may still sit behind a directory symlink the walk
+    #    doesn't follow, so only those names cost an extra stat before being
+    #    reported missing.
+    checked = []
+    work_items = []
+    for entry in ref_table:
+        if (entry.name in actual_set
+                or os.path.isfile(os.path.join(base_dir, entry.name))):
+            work_items.append((entry.name, entry))
+        else:
+            checked.append(FileResult(relative_path=entry.name, status="MISSING"))
+    work_items += [(rel_path, None) for rel_path in unexpected]
+    total_bytes = sum(
+        os.path.getsize(os.path.join(base_dir, rel_path)) for rel_path, _ in work_items
+    )
+    if total_bytes < _PARALLEL_MIN_BYTES:
+        checked += (verify_and_scan(base_dir, *item) for item in work_items)
+    else:
+        # Imported here so that small runs don't pay for loading it
+        from concurrent.futures import ThreadPoolExecutor
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checked += executor.map(
+                lambda item: verify_and_scan(base_dir, *item), work_items
+            )
+
+    # Unexpected files only get a result row when they hold placeholders
+    results: list[FileResult] = [
+        r for r in checked if r.status != "UNEXPECTED" or r.placeholder_issues
+    ]
+    placeholder_count = sum(len(r.placeholder_issues) for r in results)
+
+    # 3. Print summary
     print_summary(results, unexpected, placeholder_count)
 
     # Exit with non-zero if anything failed